@@ -1,6 +1,8 @@
-import json
+import functools
+import os
 from typing import List
 
+import orjson
 from aiogram import types
 from aiogram.dispatcher import FSMContext
 from aiogram.dispatcher.filters.state import StatesGroup, State
@@ -10,6 +12,19 @@ from sources.bot.modules.chains.survey.teacher_handlers_chain import SurveyTeach
 from sources.bot.modules.handlers_chain import HandlersChain
 from sources.bot.modules.handlers_registrar import HandlersRegistrar as Registrar
 from sources.bot.modules.keyboard.keyboard import KeyboardBuilder
+from sources.tools.config.paths import SURVEYS_PATH
+
+
+@functools.lru_cache(maxsize=128)
+def _read_survey(survey_sheet_name: str, modified_time: float) -> list:
+    with open(SURVEYS_PATH / f"{survey_sheet_name}.json", "rb") as json_file:
+        return orjson.loads(json_file.read())
+
+
+def _load_survey(survey_sheet_name: str) -> list:
+    # Modification time is a part of cache key, so rewritten survey file is read again.
+    modified_time = os.path.getmtime(SURVEYS_PATH / f"{survey_sheet_name}.json")
+    return _read_survey(survey_sheet_name, modified_time)
 
 
 class SurveyStudentStates(StatesGroup):
@@ -40,7 +55,7 @@ class StudentHandlersChain(HandlersChain):
                                  reply_markup=SurveyStudentKeyboardBuilder.get_ready_to_survey_keyboard())
 
     @staticmethod
-    @Registrar.callback_query_handler(lambda callback: callback.data.startswith("ready"))
+    @Registrar.callback_query_handler(text_startswith="ready")
     async def ready_to_pass_survey_handler(query: types.CallbackQuery, state: FSMContext):
         data = await state.get_data()
 
@@ -48,59 +63,57 @@ class StudentHandlersChain(HandlersChain):
         await SurveyStudentStates.student_ready_to_pass_test.set()
 
     @staticmethod
-    @Registrar.callback_query_handler(lambda c: c.data, state=SurveyStudentStates.student_ready_to_pass_test)
+    @Registrar.callback_query_handler(text_startswith=["start", "question"],
+                                      state=SurveyStudentStates.student_ready_to_pass_test)
     async def passing_test_handler(callback_query: types.CallbackQuery, state: FSMContext):
-        separated_data = callback_query.data.split(";")
-        survey_sheet_name = separated_data[1]
+        action, survey_sheet_name, question_number, *answer_key = callback_query.data.split(";", 3)
+        question_number = int(question_number)
         data = await state.get_data()
         tests = data.get("tests")
 
-        with open(f'surveys/{survey_sheet_name}.json', encoding='utf-8') as json_file:
-            survey = json.load(json_file)
-            if tests is None:
-                await state.update_data(tests={"is_finished": False, "answers": {}, "test_name": survey_sheet_name})
-            question_number = int(separated_data[2])
-            # Проверка ответов на правильность
-            if separated_data[0] == "question":
-                current_question = survey[question_number - 1]
-
-                answers = list(tests.get('answers'))
-                is_correct = False
-                if current_question['правильный'] == separated_data[3]:
-                    is_correct = True
-                answer = {
-                    "Вопрос": str(survey[question_number - 1]['Вопрос']),
-                    "is_correct": is_correct
-                }
-                answers.append(answer)
-                tests["answers"] = answers
-                await state.update_data(tests=tests)
-            # Формируем сообщение с вопросом и ответами
-            if question_number < len(survey):
-                current_question = survey[question_number]
-                answers_kb = SurveyTeacherKeyboardBuilder.get_answers_keyboard(current_question, question_number,
-                                                                               separated_data[1])
-                await callback_query.message.edit_text(text=f"{current_question['Вопрос']}", reply_markup=answers_kb)
-                await callback_query.answer()
-            # Тест закончен
-            else:
-                tests["is_finished"] = True
-                answers = tests.get("answers")
-
-                correct_answers = 0
-
-                for answer in answers:
-                    if answer['is_correct']:
-                        correct_answers += 1
-
-                StudentHandlersChain._logger.info(f"{callback_query.from_user.username}"
-                                                  f"(id:{callback_query.message.chat.id}) "
-                                                  f"passed test")
-                StudentHandlersChain._logger.info(f"Answers: {answers}")
-
-                tests["answers"] = answers
-                await state.update_data(tests=tests)
-
-                await SurveyStudentStates.next()
-                await callback_query.message.edit_text(text=f"Вы прошли тест на {correct_answers}/{len(answers)}")
-                await callback_query.answer()
+        if tests is None or tests.get("test_name") != survey_sheet_name:
+            tests = {"is_finished": False, "answers": [], "test_name": survey_sheet_name}
+
+        survey = tests.get("survey")
+        if survey is None:
+            survey = _load_survey(survey_sheet_name)
+            tests["survey"] = survey
+
+        # Проверка ответов на правильность
+        if action == "question":
+            current_question = survey[question_number - 1]
+
+            is_correct = False
+            if current_question['правильный'] == answer_key[0]:
+                is_correct = True
+            answer = {
+                "Вопрос": str(current_question['Вопрос']),
+                "is_correct": is_correct
+            }
+            tests["answers"].append(answer)
+        # Формируем сообщение с вопросом и ответами
+        if question_number < len(survey):
+            current_question = survey[question_number]
+            text = f"{current_question['Вопрос']}"
+            answers_kb = SurveyTeacherKeyboardBuilder.get_answers_keyboard(current_question, question_number,
+                                                                           survey_sheet_name)
+        # Тест закончен
+        else:
+            tests["is_finished"] = True
+            answers = tests["answers"]
+            correct_answers = sum(1 for answer in answers if answer['is_correct'])
+
+            StudentHandlersChain._logger.info(f"{callback_query.from_user.username}"
+                                              f"(id:{callback_query.message.chat.id}) "
+                                              f"passed test")
+            StudentHandlersChain._logger.info(f"Answers: {answers}")
+
+            text = f"Вы прошли тест на {correct_answers}/{len(answers)}"
+            answers_kb = None
+
+        await state.update_data(tests=tests)
+
+        if tests["is_finished"]:
+            await SurveyStudentStates.next()
+        await callback_query.message.edit_text(text=text, reply_markup=answers_kb)
+        await callback_query.answer()
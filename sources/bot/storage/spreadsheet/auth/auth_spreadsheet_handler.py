@@ -23,10 +23,10 @@ class AuthSpreadsheetHandler(BaseAuthSpreadsheetHandler):
         self._student_sheet_title = list(_attributes.keys())[0]
         self._teacher_sheet_title = list(_attributes.keys())[1]
 
-    def create_spreadsheet(self, spreadsheet_title="Информация о людях", row_count=1000, column_count=10):
-        self._handler.create_spreadsheet(spreadsheet_title, row_count, column_count)
+    async def create_spreadsheet(self, spreadsheet_title="Информация о людях", row_count=1000, column_count=10):
+        await self._handler.create_spreadsheet(spreadsheet_title, row_count, column_count)
 
-    def add_student(self, username: str, **kwargs):
+    async def add_student(self, username: str, **kwargs):
         name = kwargs.get("name")
         group = kwargs.get("group")
         subgroup = kwargs.get("subgroup")
@@ -38,17 +38,20 @@ class AuthSpreadsheetHandler(BaseAuthSpreadsheetHandler):
         elif not subgroup:
             raise InvalidSpreadsheetAttributeException("Invalid subgroup value")
         else:
-            self._handler.add_row(self._student_sheet_title, [username, name, group, subgroup])
+            await self._handler.add_row(self._student_sheet_title, [username, name, group, subgroup])
+            await self._handler.flush()
 
-    def remove_student(self, username: str) -> bool:
-        return self._handler.remove_row(self._student_sheet_title, username)
+    async def remove_student(self, username: str) -> bool:
+        is_removed = await self._handler.remove_row(self._student_sheet_title, username)
+        await self._handler.flush()
+        return is_removed
 
-    def get_student_usernames(self) -> List[str]:
-        return self._handler.get_first_column_sheet_range(self._student_sheet_title)
+    async def get_student_usernames(self) -> List[str]:
+        return await self._handler.get_first_column_sheet_range(self._student_sheet_title)
 
-    def get_student_by_username(self, username: str) -> dict:
+    async def get_student_by_username(self, username: str) -> dict:
         student = {}
-        data = self._handler.get_row_by_first_element(self._student_sheet_title, username)
+        data = await self._handler.get_row_by_first_element(self._student_sheet_title, username)
         name = data.get("ФИО")
         group = data.get("Группа")
         subgroup = data.get("Подгруппа")
@@ -58,23 +61,26 @@ class AuthSpreadsheetHandler(BaseAuthSpreadsheetHandler):
 
         return student
 
-    def add_teacher(self, username: str, **kwargs) -> None:
+    async def add_teacher(self, username: str, **kwargs) -> None:
         name = kwargs.get("name")
 
         if not name:
             raise InvalidSpreadsheetAttributeException("Invalid name value")
         else:
-            self._handler.add_row(self._teacher_sheet_title, [username, name])
+            await self._handler.add_row(self._teacher_sheet_title, [username, name])
+            await self._handler.flush()
 
-    def remove_teacher(self, username: str) -> bool:
-        return self._handler.remove_row(self._teacher_sheet_title, username)
+    async def remove_teacher(self, username: str) -> bool:
+        is_removed = await self._handler.remove_row(self._teacher_sheet_title, username)
+        await self._handler.flush()
+        return is_removed
 
-    def get_teacher_usernames(self) -> List[str]:
-        return self._handler.get_first_column_sheet_range(self._teacher_sheet_title)
+    async def get_teacher_usernames(self) -> List[str]:
+        return await self._handler.get_first_column_sheet_range(self._teacher_sheet_title)
 
-    def get_teacher_by_username(self, username: str) -> dict:
+    async def get_teacher_by_username(self, username: str) -> dict:
         teacher = {}
-        data = self._handler.get_row_by_first_element(self._teacher_sheet_title, username)
+        data = await self._handler.get_row_by_first_element(self._teacher_sheet_title, username)
         name = data.get("ФИО")
 
         if name:
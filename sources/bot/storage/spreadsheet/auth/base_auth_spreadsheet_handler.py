@@ -15,7 +15,7 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
     __metaclass__ = ABCMeta
 
     @abstractmethod
-    def add_student(self, username: str, **kwargs):
+    async def add_student(self, username: str, **kwargs):
         """
         Adds student data in spreadsheet.
 
@@ -28,7 +28,7 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
         raise NotImplementedError
 
     @abstractmethod
-    def remove_student(self, username: str) -> bool:
+    async def remove_student(self, username: str) -> bool:
         """
         Removes student with fields from spreadsheet by his username.
 
@@ -43,7 +43,7 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
         return False
 
     @abstractmethod
-    def get_student_usernames(self) -> List[str]:
+    async def get_student_usernames(self) -> List[str]:
         """
         Gets all student usernames from spreadsheet.
 
@@ -55,7 +55,7 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
         raise NotImplementedError
 
     @abstractmethod
-    def get_student_by_username(self, username: str) -> dict:
+    async def get_student_by_username(self, username: str) -> dict:
         """
         Gets student with fields from spreadsheet by his username.
 
@@ -70,7 +70,7 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
         raise NotImplementedError
 
     @abstractmethod
-    def add_teacher(self, username: str, **kwargs):
+    async def add_teacher(self, username: str, **kwargs):
         """
         Adds teacher data in spreadsheet.
 
@@ -83,7 +83,7 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
         raise NotImplementedError
 
     @abstractmethod
-    def remove_teacher(self, username: str) -> bool:
+    async def remove_teacher(self, username: str) -> bool:
         """
         Removes teacher with fields from spreadsheet by his username.
 
@@ -98,7 +98,7 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
         return False
 
     @abstractmethod
-    def get_teacher_usernames(self) -> List[str]:
+    async def get_teacher_usernames(self) -> List[str]:
         """
         Gets all teacher usernames from spreadsheet.
 
@@ -110,7 +110,7 @@ class BaseAuthSpreadsheetHandler(BaseSpreadsheetHandler):
         raise NotImplementedError
 
     @abstractmethod
-    def get_teacher_by_username(self, username: str) -> dict:
+    async def get_teacher_by_username(self, username: str) -> dict:
         """
         Gets teacher with fields from spreadsheet by his username.
 
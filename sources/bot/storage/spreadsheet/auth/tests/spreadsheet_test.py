@@ -3,8 +3,8 @@ import unittest
 from ..auth_spreadsheet_handler import AuthSpreadsheetHandler
 
 
-class TestSpreadsheet(unittest.TestCase):
-    def setUp(self):
+class TestSpreadsheet(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
         token_path = "../../../../../tokens/auth_token.json"
         self.handler = AuthSpreadsheetHandler("", token_path)
-        self.handler.create_spreadsheet()
+        await self.handler.create_spreadsheet()
@@ -12,7 +12,7 @@ class BaseSpreadsheetHandler:
     __metaclass__ = ABCMeta
 
     @abstractmethod
-    def create_spreadsheet(self, spreadsheet_title: str = None, row_count: int = None, column_count: int = None):
+    async def create_spreadsheet(self, spreadsheet_title: str = None, row_count: int = None, column_count: int = None):
         """
         Creates concrete spreadsheet with title, row and column amount.
 
@@ -1,10 +1,62 @@
 """
 Row spreadsheet handler implementation module.
 """
-from typing import List, Dict
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Union
 import httplib2
 import apiclient
-from oauth2client.service_account import ServiceAccountCredentials
+from cachetools import TTLCache
+from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import BatchHttpRequest, HttpRequest
+
+_SCOPES = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
+_SHEETS_POOL = ThreadPoolExecutor(max_workers=8)
+_WORKER_HTTP = threading.local()
+
+# Services are built once from bundled discovery documents, requests are authorized in execute_request.
+SHEETS_SERVICE = apiclient.discovery.build("sheets", "v4", http=httplib2.Http(), static_discovery=True)
+DRIVE_SERVICE = apiclient.discovery.build("drive", "v3", http=httplib2.Http(), static_discovery=True)
+
+
+def get_credentials(credentials_file_name: str) -> Credentials:
+    """
+    Gets service account credentials with spreadsheets and drive scopes.
+
+    :param credentials_file_name: Service account credentials file name
+    :type credentials_file_name: :obj:`str`
+
+    :return: Returns service account credentials.
+    :rtype: :obj:`Credentials`
+    """
+    return Credentials.from_service_account_file(credentials_file_name, scopes=_SCOPES)
+
+
+def _get_worker_http(credentials: Credentials) -> AuthorizedHttp:
+    # httplib2 is not thread-safe, so each pool worker keeps its own persistent connection.
+    if not hasattr(_WORKER_HTTP, "http"):
+        _WORKER_HTTP.http = httplib2.Http()
+
+    return AuthorizedHttp(credentials, http=_WORKER_HTTP.http)
+
+
+async def execute_request(request: Union[HttpRequest, BatchHttpRequest], credentials: Credentials):
+    """
+    Executes Google API request in worker thread pool without blocking event loop.
+
+    :param request: Google API request
+    :type request: :obj:`HttpRequest` or :obj:`BatchHttpRequest`
+
+    :param credentials: Service account credentials
+    :type credentials: :obj:`Credentials`
+
+    :return: Returns deserialized response.
+    :rtype: :obj:`dict`
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_SHEETS_POOL, lambda: request.execute(http=_get_worker_http(credentials)))
 
 
 class SpreadsheetHandler:
@@ -12,66 +64,44 @@ class SpreadsheetHandler:
     Row spreadsheet handler class  implementation.
     """
 
-    def __init__(self, spreadsheet_id: str, file_name: str, sheet_attributes: Dict[str, List[str]]):
+    def __init__(
+        self,
+        spreadsheet_id: str,
+        file_name: str,
+        sheet_attributes: Dict[str, List[str]],
+        bounded_first_column: bool = False,
+    ):
         self._spreadsheet_id = spreadsheet_id
         self._credentials_file = file_name
         self._sheet_attributes = sheet_attributes
         self._created_sheets = []
-
-        self._credentials = ServiceAccountCredentials.from_json_keyfile_name(
-            self._credentials_file,
-            ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"],
-        )
-        self._http_auth = self._credentials.authorize(httplib2.Http())
-        self._service = apiclient.discovery.build("sheets", "v4", http=self._http_auth)
+        self._title_iter = reversed(list(self._sheet_attributes))
+        self._row_count = 1000
+        self._bounded_first_column = bounded_first_column
+        self._pending_ops = []
+        self._pending_appends = {}
+        # Own mutations are applied to cached columns locally, TTL bounds staleness after external edits.
+        self._first_columns = TTLCache(maxsize=32, ttl=10)
+        self._sheet_ids = {}
+        # Row numbers come from shared cached columns, so mutations of all chats are serialized.
+        self._rows_lock = asyncio.Lock()
+
+        self._credentials = get_credentials(self._credentials_file)
+        self._service = SHEETS_SERVICE
+        self._drive_service = DRIVE_SERVICE
 
         if len(spreadsheet_id) != 0:
             print(
                 f"Open existing spreadsheet at https://docs.google.com/spreadsheets/d/{self._spreadsheet_id}/edit#gid=0"
             )
 
-    def _pop_sheet_title(self) -> str and list:
-        keys = self._sheet_attributes.keys()
-        titles = list(keys)
-        sheet_title = titles[len(keys) - len(self._created_sheets) - 1]
-        attributes = self._sheet_attributes.get(sheet_title)
+    def _pop_sheet_title(self) -> Tuple[str, List[str]]:
+        sheet_title = next(self._title_iter)
+        attributes = self._sheet_attributes[sheet_title]
         self._created_sheets.append(sheet_title)
         return sheet_title, attributes
 
-    def _create_sheet(self, row_count: int, column_count: int) -> None:
-        sheet_title, attributes = self._pop_sheet_title()
-
-        self._service.spreadsheets().batchUpdate(
-            spreadsheetId=self._spreadsheet_id,
-            body={
-                "requests": [
-                    {
-                        "addSheet": {
-                            "properties": {
-                                "title": sheet_title,
-                                "gridProperties": {"rowCount": row_count, "columnCount": column_count},
-                            }
-                        }
-                    }
-                ]
-            },
-        ).execute()
-
-        self._service.spreadsheets().values().batchUpdate(
-            spreadsheetId=self._spreadsheet_id,
-            body={
-                "valueInputOption": "USER_ENTERED",
-                "data": [
-                    {
-                        "range": f"{sheet_title}!A1:D1",
-                        "majorDimension": "ROWS",
-                        "values": [attributes],
-                    }
-                ],
-            },
-        ).execute()
-
-    def create_spreadsheet(self, spreadsheet_title: str, row_count: int, column_count: int):
+    async def create_spreadsheet(self, spreadsheet_title: str, row_count: int, column_count: int):
         """
         Creates spreadsheet with title, row and column amount.
 
@@ -84,53 +114,70 @@ class SpreadsheetHandler:
         :param column_count: Spreadsheet column amount
         :type column_count: :obj:`int`
         """
-        sheet_title, attributes = self._pop_sheet_title()
-
-        spreadsheet = (
-            self._service.spreadsheets()
-            .create(
-                body={
-                    "properties": {"title": spreadsheet_title, "locale": "ru_RU"},
-                    "sheets": [
-                        {
-                            "properties": {
-                                "sheetType": "GRID",
-                                "sheetId": 0,
-                                "title": sheet_title,
-                                "gridProperties": {"rowCount": row_count, "columnCount": column_count},
-                            }
-                        }
-                    ],
+        self._row_count = row_count
+        sheets = []
+        headers = []
+
+        while len(self._created_sheets) != len(self._sheet_attributes):
+            sheet_title, attributes = self._pop_sheet_title()
+            sheets.append(
+                {
+                    "properties": {
+                        "sheetType": "GRID",
+                        "sheetId": len(sheets),
+                        "title": sheet_title,
+                        "gridProperties": {"rowCount": row_count, "columnCount": column_count},
+                    }
                 }
             )
-            .execute()
+            headers.append(
+                {
+                    "range": f"{sheet_title}!A1:{self._get_right_corner(sheet_title)}1",
+                    "majorDimension": "ROWS",
+                    "values": [attributes],
+                }
+            )
+
+        request = self._service.spreadsheets().create(
+            body={"properties": {"title": spreadsheet_title, "locale": "ru_RU"}, "sheets": sheets}
         )
+        spreadsheet = await execute_request(request, self._credentials)
 
         self._spreadsheet_id = spreadsheet["spreadsheetId"]
+        for sheet in sheets:
+            self._sheet_ids[sheet["properties"]["title"]] = sheet["properties"]["sheetId"]
 
         print(f"Created new spreadsheet at https://docs.google.com/spreadsheets/d/{self._spreadsheet_id}/edit#gid=0")
 
-        self._service.spreadsheets().values().batchUpdate(
-            spreadsheetId=self._spreadsheet_id,
-            body={
-                "valueInputOption": "USER_ENTERED",
-                "data": [{"range": f"{sheet_title}!A1:D1", "majorDimension": "ROWS", "values": [attributes]}],
-            },
-        ).execute()
+        request = (
+            self._service.spreadsheets()
+            .values()
+            .batchUpdate(
+                spreadsheetId=self._spreadsheet_id,
+                body={"valueInputOption": "USER_ENTERED", "data": headers},
+            )
+        )
+        await execute_request(request, self._credentials)
 
-        while len(self._created_sheets) != len(self._sheet_attributes.keys()):
-            self._create_sheet(row_count, column_count)
+        await self._get_permissions([{"type": "anyone", "role": "reader"}])
 
-        self._get_permissions()
+    @staticmethod
+    def _raise_batch_error(request_id: str, response: dict, exception: Exception) -> None:
+        if exception is not None:
+            raise exception
 
-    def _get_permissions(self) -> None:
-        drive_service = apiclient.discovery.build("drive", "v3", http=self._http_auth)
-        drive_service.permissions().create(
-            fileId=self._spreadsheet_id, body={"type": "anyone", "role": "reader"}, fields="id"
-        ).execute()
+    async def _get_permissions(self, permissions: List[Dict[str, str]]) -> None:
+        batch = self._drive_service.new_batch_http_request(callback=self._raise_batch_error)
 
-    def _get_sheet_range(self, spreadsheet_title: str, corner_from: str, corner_to: str):
-        return (
+        for permission in permissions:
+            batch.add(
+                self._drive_service.permissions().create(fileId=self._spreadsheet_id, body=permission, fields="id")
+            )
+
+        await execute_request(batch, self._credentials)
+
+    async def _get_sheet_range(self, spreadsheet_title: str, corner_from: str, corner_to: str):
+        request = (
             self._service.spreadsheets()
             .values()
             .batchGet(
@@ -139,32 +186,118 @@ class SpreadsheetHandler:
                 valueRenderOption="FORMATTED_VALUE",
                 dateTimeRenderOption="FORMATTED_STRING",
             )
-            .execute()
         )
+        return await execute_request(request, self._credentials)
+
+    async def _get_first_column_sheet_range(self, spreadsheet_title: str):
+        if self._bounded_first_column:
+            return await self._get_sheet_range(spreadsheet_title, "A1", f"A{self._row_count}")
+
+        return await self._get_sheet_range(spreadsheet_title, "A", "A")
+
+    async def _get_first_column(self, spreadsheet_title: str) -> list:
+        first_column = self._first_columns.get(spreadsheet_title)
+        if first_column is None:
+            results = await self._get_first_column_sheet_range(spreadsheet_title)
+            first_column = results["valueRanges"][0].get("values", [])
+            self._first_columns[spreadsheet_title] = first_column
+
+        return first_column
+
+    @staticmethod
+    def _index_first_column(sheet_values: list) -> Dict[str, int]:
+        first_column_index = {}
+        for i, sheet_row in enumerate(sheet_values):
+            if sheet_row:
+                first_column_index.setdefault(sheet_row[0], i)
+
+        return first_column_index
+
+    async def _get_sheet_id(self, spreadsheet_title: str) -> int:
+        if spreadsheet_title not in self._sheet_ids:
+            request = self._service.spreadsheets().get(
+                spreadsheetId=self._spreadsheet_id, fields="sheets.properties(sheetId,title)"
+            )
+            spreadsheet = await execute_request(request, self._credentials)
+            for sheet in spreadsheet.get("sheets", []):
+                self._sheet_ids[sheet["properties"]["title"]] = sheet["properties"]["sheetId"]
+
+        return self._sheet_ids[spreadsheet_title]
+
+    def _get_right_corner(self, spreadsheet_title: str) -> str:
+        return chr(ord("A") + len(self._sheet_attributes[spreadsheet_title]) - 1)
+
+    def _cache_first_column_row(self, spreadsheet_title: str, row_number: int, values: List[str]) -> None:
+        first_column = self._first_columns.get(spreadsheet_title)
+        if first_column is not None:
+            first_column.extend([] for _ in range(row_number - len(first_column)))
+            first_column[row_number - 1] = [values[0]] if values[0] else []
+
+    def _overwrite_row(self, spreadsheet_title: str, row_number: int, values: List[str]) -> None:
+        right_corner = self._get_right_corner(spreadsheet_title)
+        self._pending_ops.append(
+            {
+                "range": f"{spreadsheet_title}!A{row_number}:{right_corner}{row_number}",
+                "majorDimension": "ROWS",
+                "values": [values],
+            }
+        )
+        self._cache_first_column_row(spreadsheet_title, row_number, values)
+
+    def _append_row(self, spreadsheet_title: str, values: List[str]) -> None:
+        self._pending_appends.setdefault(spreadsheet_title, []).append(values)
+
+        first_column = self._first_columns.get(spreadsheet_title, [])
+        self._cache_first_column_row(spreadsheet_title, len(first_column) + 1, values)
 
-    def _get_first_column_sheet_range(self, spreadsheet_title: str):
-        return self._get_sheet_range(spreadsheet_title, "A1", "A1000")
-
-    def _update_spreadsheet_row(self, spreadsheet_title: str, row_number: int, values: List[str]) -> None:
-        self._service.spreadsheets().values().batchUpdate(
-            spreadsheetId=self._spreadsheet_id,
-            body={
-                "valueInputOption": "USER_ENTERED",
-                "data": [
-                    {
-                        "range": f"{spreadsheet_title}!A{row_number}:D{row_number}",
-                        "majorDimension": "ROWS",
-                        "values": [values],
-                    },
-                ],
-            },
-        ).execute()
-
-    def add_row(self, spreadsheet_title: str, row: List[str]):
+    async def flush(self) -> None:
+        """
+        Sends all pending row mutations to spreadsheet.
+
+        Note: Overwritten rows are sent with one batch update and then appended rows with one append per sheet.
+        Cached first columns of sheets with appended rows are invalidated, because server places appended rows.
+        """
+        async with self._rows_lock:
+            await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        pending_ops, self._pending_ops = self._pending_ops, []
+        pending_appends, self._pending_appends = self._pending_appends, {}
+
+        for spreadsheet_title in pending_appends:
+            self._first_columns.pop(spreadsheet_title, None)
+
+        # Append fills blank rows of table, so it must not land before overwrite of such row.
+        if pending_ops:
+            request = (
+                self._service.spreadsheets()
+                .values()
+                .batchUpdate(
+                    spreadsheetId=self._spreadsheet_id,
+                    body={"valueInputOption": "USER_ENTERED", "data": pending_ops},
+                )
+            )
+            await execute_request(request, self._credentials)
+
+        for spreadsheet_title, rows in pending_appends.items():
+            request = (
+                self._service.spreadsheets()
+                .values()
+                .append(
+                    spreadsheetId=self._spreadsheet_id,
+                    range=spreadsheet_title,
+                    valueInputOption="USER_ENTERED",
+                    insertDataOption="INSERT_ROWS",
+                    body={"values": rows},
+                )
+            )
+            await execute_request(request, self._credentials)
+
+    async def add_row(self, spreadsheet_title: str, row: List[str]):
         """
         Adds one single row with fields in spreadsheet.
 
-        Note: If such row exists then it will change.
+        Note: If such row exists then it will change. Row is sent to spreadsheet on flush.
 
         :param spreadsheet_title: Spreadsheet title
         :type spreadsheet_title: :obj:`str`
@@ -172,26 +305,30 @@ class SpreadsheetHandler:
         :param row: Spreadsheet appendable row
         :type row: :obj:`List[str]`
         """
-        first_row_element = row[0]
-        results = self._get_first_column_sheet_range(spreadsheet_title)
-        sheet_values = results["valueRanges"][0]["values"]
-        row_number = len(sheet_values) + 1
-
-        for sheet_rows in sheet_values:
-            if not sheet_rows:
-                row_number = sheet_values.index([]) + 1
-                break
-            if sheet_rows[0] == first_row_element:
-                row_number = sheet_values.index([first_row_element]) + 1
-                break
-
-        self._update_spreadsheet_row(spreadsheet_title, row_number, row)
-
-    def remove_row(self, spreadsheet_title: str, first_row_element: str) -> bool:
+        async with self._rows_lock:
+            # Row which is not on server yet is replaced in place, otherwise its overwrite can land before append.
+            pending_rows = self._pending_appends.get(spreadsheet_title, [])
+            for i, pending_row in enumerate(pending_rows):
+                if pending_row[0] == row[0]:
+                    pending_rows[i] = row
+                    return
+
+            sheet_values = await self._get_first_column(spreadsheet_title)
+            match_index = self._index_first_column(sheet_values).get(row[0])
+            first_empty_index = next((i for i, sheet_row in enumerate(sheet_values) if not sheet_row), None)
+            row_index = match_index if match_index is not None else first_empty_index
+
+            if row_index is None:
+                self._append_row(spreadsheet_title, row)
+            else:
+                self._overwrite_row(spreadsheet_title, row_index + 1, row)
+
+    async def remove_row(self, spreadsheet_title: str, first_row_element: str) -> bool:
         """
         Removes one single row with fields from spreadsheet.
 
-        Note: If such row doesn't exist then it won't be removed.
+        Note: If such row doesn't exist then it won't be removed. Pending mutations are flushed before removal,
+        because rows below removed one are shifted up.
 
         :param spreadsheet_title: Spreadsheet title
         :type spreadsheet_title: :obj:`str`
@@ -202,22 +339,40 @@ class SpreadsheetHandler:
         :return: Returns True on success.
         :rtype: :obj:`bool`
         """
-        results = self._get_first_column_sheet_range(spreadsheet_title)
-        sheet_values = results["valueRanges"][0]["values"]
-
-        if sheet_values.count([first_row_element]) == 0:
-            return False
-
-        row_number = sheet_values.index([first_row_element]) + 1
-
-        empty_string_list = []
-        for i in range(len(self._sheet_attributes.get(spreadsheet_title))):
-            empty_string_list.append("")
+        async with self._rows_lock:
+            await self._flush_pending()
+            # Deletion is destructive, so row index is taken from fresh column instead of possibly stale cache.
+            self._first_columns.pop(spreadsheet_title, None)
+            sheet_values = await self._get_first_column(spreadsheet_title)
+            row_index = self._index_first_column(sheet_values).get(first_row_element)
+
+            if row_index is None:
+                return False
+
+            sheet_id = await self._get_sheet_id(spreadsheet_title)
+            request = self._service.spreadsheets().batchUpdate(
+                spreadsheetId=self._spreadsheet_id,
+                body={
+                    "requests": [
+                        {
+                            "deleteDimension": {
+                                "range": {
+                                    "sheetId": sheet_id,
+                                    "dimension": "ROWS",
+                                    "startIndex": row_index,
+                                    "endIndex": row_index + 1,
+                                }
+                            }
+                        }
+                    ]
+                },
+            )
+            await execute_request(request, self._credentials)
 
-        self._update_spreadsheet_row(spreadsheet_title, row_number, empty_string_list)
-        return True
+            del sheet_values[row_index]
+            return True
 
-    def get_first_column_sheet_range(self, spreadsheet_title: str) -> list:
+    async def get_first_column_sheet_range(self, spreadsheet_title: str) -> list:
         """
         Gets first column in spreadsheet.
 
@@ -229,11 +384,11 @@ class SpreadsheetHandler:
         :return: Returns first column with fields in spreadsheet.
         :rtype: :obj:`list[str]`
         """
-        results = self._get_first_column_sheet_range(spreadsheet_title)
-        sheet_values = results["valueRanges"][0]["values"]
+        await self.flush()
+        sheet_values = await self._get_first_column(spreadsheet_title)
         return list(filter(lambda v: v != [], sheet_values[1:]))
 
-    def get_row_by_first_element(self, spreadsheet_title: str, element: str) -> dict:
+    async def get_row_by_first_element(self, spreadsheet_title: str, element: str) -> dict:
         """
         Gets row in spreadsheet by its first field.
 
@@ -248,21 +403,14 @@ class SpreadsheetHandler:
         :return: Returns row with fields.
         :rtype: :obj:`dict[str, str]`
         """
-        alphabet_start_index = 64
-        right_corner = chr(alphabet_start_index + len(self._sheet_attributes.get(spreadsheet_title)))
-        results = self._get_sheet_range(spreadsheet_title, "A2", f"{right_corner}1000")
-
-        if results["valueRanges"][0].get("values"):
-            sheet_values = results["valueRanges"][0]["values"]
-        else:
-            return {}
-
-        row = {}
-        i = 0
-        for sheet_row in sheet_values:
+        attributes = self._sheet_attributes[spreadsheet_title]
+        right_corner = self._get_right_corner(spreadsheet_title)
+
+        await self.flush()
+        results = await self._get_sheet_range(spreadsheet_title, "A2", right_corner)
+
+        for sheet_row in results["valueRanges"][0].get("values", []):
             if sheet_row and sheet_row[0] == element:
-                for attribute in self._sheet_attributes.get(spreadsheet_title):
-                    row[attribute] = sheet_row[i]
-                    i += 1
+                return dict(zip(attributes, sheet_row))
 
-        return row
+        return {}
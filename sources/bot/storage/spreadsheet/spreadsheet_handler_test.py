@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from . import spreadsheet_handler
+from .spreadsheet_handler import SpreadsheetHandler
+
+
+class TestSpreadsheetHandlerRows(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        with patch.object(spreadsheet_handler, "get_credentials"):
+            self.handler = SpreadsheetHandler(
+                "", "token.json", {"Студенты": ["username", "ФИО", "Группа", "Подгруппа"]}
+            )
+        self.handler._service = MagicMock()
+
+    async def test_get_later_matching_row(self):
+        values = [
+            ["student1", "name1", "group1", "subgroup1"],
+            [],
+            ["student2", "name2", "group2", "subgroup2"],
+            ["student3", "name3"],
+        ]
+        response = {"valueRanges": [{"values": values}]}
+
+        with patch.object(spreadsheet_handler, "execute_request", AsyncMock(return_value=response)):
+            student2 = await self.handler.get_row_by_first_element("Студенты", "student2")
+            student3 = await self.handler.get_row_by_first_element("Студенты", "student3")
+            unknown = await self.handler.get_row_by_first_element("Студенты", "unknown")
+
+        self.assertEqual(
+            student2, {"username": "student2", "ФИО": "name2", "Группа": "group2", "Подгруппа": "subgroup2"}
+        )
+        self.assertEqual(student3, {"username": "student3", "ФИО": "name3"})
+        self.assertEqual(unknown, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,14 @@
-import json
+import asyncio
 import os
-import sys
+import pathlib
+import tempfile
 from datetime import datetime
 
-import apiclient
-import httplib2
+import orjson
 from googleapiclient.errors import HttpError
-from oauth2client.service_account import ServiceAccountCredentials
 
+from .....tools.config.paths import SURVEYS_PATH
+from ..spreadsheet_handler import SHEETS_SERVICE, execute_request, get_credentials
 from .base_tests_spreadsheet_handler import BaseTestsSpreadsheetHandler
 
 
@@ -15,20 +16,20 @@ class TestsSpreadsheetHandler(BaseTestsSpreadsheetHandler):
     def __init__(self, credentials_file_name: str):
         self._loaded_tests = {}
         self._current_test_id = ""
-        self._http_auth = ServiceAccountCredentials.from_json_keyfile_name(
-            credentials_file_name,
-            ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"],
-        ).authorize(httplib2.Http())
-        self._service = apiclient.discovery.build("sheets", "v4", http=self._http_auth)
-
-    def _add_row(self, test_name: str, row: list[str], test_id: str):
-        self._service.spreadsheets().values().append(spreadsheetId=test_id,
-                                                     range=test_name,
-                                                     valueInputOption="USER_ENTERED",
-                                                     insertDataOption="INSERT_ROWS",
-                                                     body={"values": [row]}).execute()
-
-    def _create_page(self, title: str, spreadsheet_id: str):
+        self._page_names_cache = {}
+        self._results_lock = asyncio.Lock()
+        self._credentials = get_credentials(credentials_file_name)
+        self._service = SHEETS_SERVICE
+
+    async def _add_rows(self, test_name: str, rows: list[list[str]], test_id: str):
+        request = self._service.spreadsheets().values().append(spreadsheetId=test_id,
+                                                               range=test_name,
+                                                               valueInputOption="USER_ENTERED",
+                                                               insertDataOption="INSERT_ROWS",
+                                                               body={"values": rows})
+        await execute_request(request, self._credentials)
+
+    async def _create_page(self, title: str, spreadsheet_id: str):
         data = {'requests': [
             {
                 'addSheet': {
@@ -36,100 +37,107 @@ class TestsSpreadsheetHandler(BaseTestsSpreadsheetHandler):
                 }
             }
         ]}
-        self._service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id,
-                                                 body=data).execute()
+        request = self._service.spreadsheets().batchUpdate(spreadsheetId=spreadsheet_id,
+                                                           body=data)
+        await execute_request(request, self._credentials)
 
-    def load_test_by_link(self, url: str):
+    async def load_test_by_link(self, url: str):
         url_details = url.split("/")
         spreadsheet_id = url_details[url_details.index("d") + 1]
         self._current_test_id = spreadsheet_id
-        return self._get_test(spreadsheet_id)
-
-    def _get_test(self, spreadsheet_id: str) -> tuple[str, list[dict]]:
+        return await self._get_test(spreadsheet_id)
+
+    async def _get_test(self, spreadsheet_id: str) -> tuple[str, list[dict]]:
+        title_request = self._service.spreadsheets().get(spreadsheetId=spreadsheet_id,
+                                                         fields="properties.title")
+        values_request = self._service.spreadsheets().values().get(spreadsheetId=spreadsheet_id,
+                                                                   range="Тест",
+                                                                   valueRenderOption="FORMATTED_VALUE")
         try:
-            spreadsheets = self._service.spreadsheets().get(spreadsheetId=spreadsheet_id,
-                                                            includeGridData=True).execute()
+            spreadsheet, test_range = await asyncio.gather(execute_request(title_request, self._credentials),
+                                                           execute_request(values_request, self._credentials))
         except HttpError:
             return "", []
-        test_name = spreadsheets["properties"]["title"]
-        raw_data = []
-        for sheet in spreadsheets["sheets"]:
-            if sheet["properties"]["title"] == "Тест":
-                for sheet_data in sheet["data"][0]["rowData"]:
-                    if len(sheet_data) > 0:
-                        raw_data.append(sheet_data)
+        test_name = spreadsheet["properties"]["title"]
+        keys, *rows = test_range.get("values", [[]])
 
         survey = []
-        keys = []
-
-        for key in raw_data[0]["values"]:
-            keys.append(key["formattedValue"])
-
-        raw_data.remove(raw_data[0])
-        for element in raw_data:
-            question = {}
-            index = 0
-            for string in element["values"]:
-                if len(string) > 3:
-                    question[str(keys[index])] = string["formattedValue"]
-                index += 1
-            survey.append(question)
-
-        for el in survey:
-            if len(el) < 1:
-                survey.remove(el)
-
-        self._save_test(test_name, survey)
+        for row in rows:
+            question = {key: value for key, value in zip(keys, row) if value}
+            if question:
+                survey.append(question)
+
+        await self._save_test(test_name, survey)
         return test_name, survey
 
-    def _save_test(self, test_name: str, test: list[dict]) -> None:
+    async def _save_test(self, test_name: str, test: list[dict]) -> None:
         if not test_name == "":
-            current_path = os.path.dirname(sys.argv[0])  # needs to be configured in config.ini
-            path = f'{current_path}\\surveys'
-            os.makedirs(path, exist_ok=True)
-            with open(f'surveys/{test_name}.json', 'w', encoding='utf-8') as f:
-                json.dump(test, f, ensure_ascii=False, indent=4)
-
-    def add_result_to_worksheet(self, test_name, user_data, result_list) -> None:
-        if test_name + "_result" not in self._get_page_names(self._current_test_id):
-            self._create_page(test_name + "_result", self._current_test_id)
-            top_row = ["Студент", "Время"]
-            for q in result_list:
-                top_row.append(q["Вопрос"])
-            top_row.append("Результат")
-            self._add_row(test_name + "_result", top_row, self._current_test_id)
-
-        correct_answers = 0
-        boolean_answer_list = []
-
-        for answer in result_list:
-            if answer['is_correct']:
-                correct_answers += 1
-                boolean_answer_list.append("Верно")
-            else:
-                boolean_answer_list.append("Неверно")
-
-        row = [user_data, str(datetime.now())]
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_test, SURVEYS_PATH / f"{test_name}.json", test)
 
-        for ans in boolean_answer_list:
-            row.append(ans)
-
-        row.append(f"{correct_answers}/{len(result_list)}")
-
-        self._add_row(test_name + "_result", row, self._current_test_id)
+    @staticmethod
+    def _write_test(path: pathlib.Path, test: list[dict]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False)
+        try:
+            with f:
+                f.write(orjson.dumps(test, option=orjson.OPT_INDENT_2))
+            # Temporary file is owner-only, saved survey keeps permissions of regular file.
+            os.chmod(f.name, 0o644)
+            os.replace(f.name, path)
+        except BaseException:
+            os.unlink(f.name)
+            raise
+
+    async def add_result_to_worksheet(self, test_name, user_data, result_list) -> None:
+        boolean_answer_list = ["Верно" if answer['is_correct'] else "Неверно" for answer in result_list]
+        correct_answers = boolean_answer_list.count("Верно")
+
+        now = datetime.now().isoformat(sep=" ", timespec="seconds")
+        row = [user_data, now, *boolean_answer_list, f"{correct_answers}/{len(result_list)}"]
+        page_name = test_name + "_result"
+        spreadsheet_id = self._current_test_id
+
+        # Only pages cached with their header row are appended to without lock.
+        if page_name in self._page_names_cache.get(spreadsheet_id, ()):
+            try:
+                await self._add_rows(page_name, [row], spreadsheet_id)
+                return
+            except HttpError:
+                # Results page can be renamed or deleted in spreadsheet, so page names are read again.
+                self._page_names_cache.pop(spreadsheet_id, None)
+
+        await self._add_first_result(page_name, row, result_list, spreadsheet_id)
+
+    async def _add_first_result(self, page_name: str, row: list[str], result_list, spreadsheet_id: str) -> None:
+        # Concurrent submissions of a fresh test must not create the results page twice.
+        async with self._results_lock:
+            if page_name not in await self._get_page_names(spreadsheet_id):
+                await self._create_page(page_name, spreadsheet_id)
+                top_row = ["Студент", "Время"]
+                for q in result_list:
+                    top_row.append(q["Вопрос"])
+                top_row.append("Результат")
+                await self._add_rows(page_name, [top_row, row], spreadsheet_id)
+                self._page_names_cache.setdefault(spreadsheet_id, set()).add(page_name)
+                return
+
+        await self._add_rows(page_name, [row], spreadsheet_id)
+
+    async def _get_page_names(self, spreadsheet_id: str) -> set:
+        if spreadsheet_id in self._page_names_cache:
+            return self._page_names_cache[spreadsheet_id]
 
-    def _get_page_names(self, spreadsheet_id: str) -> list:
         try:
-            sheet_metadata = self._service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            request = self._service.spreadsheets().get(spreadsheetId=spreadsheet_id,
+                                                       fields="sheets.properties.title")
+            sheet_metadata = await execute_request(request, self._credentials)
         except HttpError:
-            return []
-
-        sheets = sheet_metadata.get('sheets', '')
-
-        sheet_names = []
+            return set()
 
-        for sheet in sheets:
-            sheet_names.append(sheet["properties"]["title"])
+        sheets = sheet_metadata.get('sheets', [])
+        sheet_names = {sheet["properties"]["title"] for sheet in sheets}
+        self._page_names_cache[spreadsheet_id] = sheet_names
 
         return sheet_names
 
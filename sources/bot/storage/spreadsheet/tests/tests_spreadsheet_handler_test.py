@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from . import tests_spreadsheet_handler
+from .tests_spreadsheet_handler import TestsSpreadsheetHandler
+
+
+class TestTestsSpreadsheetHandlerSurvey(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        with patch.object(tests_spreadsheet_handler, "get_credentials"):
+            self.handler = TestsSpreadsheetHandler("token.json")
+        self.handler._service = MagicMock()
+        self.handler._save_test = AsyncMock()
+
+    async def test_skip_empty_questions(self):
+        spreadsheets = self.handler._service.spreadsheets.return_value
+        responses = {
+            spreadsheets.get.return_value: {"properties": {"title": "Тест 1"}},
+            spreadsheets.values.return_value.get.return_value: {
+                "values": [
+                    ["Вопрос", "ответ1", "ответ2", "правильный"],
+                    ["Вопрос 1", "1", "2", "ответ1"],
+                    [],
+                    ["", "", ""],
+                    ["Вопрос 2", "3", "", "ответ1"],
+                ]
+            },
+        }
+        execute_request = AsyncMock(side_effect=lambda request, credentials: responses[request])
+
+        with patch.object(tests_spreadsheet_handler, "execute_request", execute_request):
+            test_name, survey = await self.handler.load_test_by_link("https://docs.google.com/spreadsheets/d/id/edit")
+
+        self.assertEqual(test_name, "Тест 1")
+        self.assertEqual(
+            survey,
+            [
+                {"Вопрос": "Вопрос 1", "ответ1": "1", "ответ2": "2", "правильный": "ответ1"},
+                {"Вопрос": "Вопрос 2", "ответ1": "3", "правильный": "ответ1"},
+            ],
+        )
+        self.handler._save_test.assert_awaited_once_with("Тест 1", survey)
+
+
+if __name__ == "__main__":
+    unittest.main()
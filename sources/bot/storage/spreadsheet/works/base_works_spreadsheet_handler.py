@@ -7,9 +7,9 @@ class BaseWorksSpreadsheetHandler(BaseSpreadsheetHandler):
     __metaclass__ = ABCMeta
 
     @abstractmethod
-    def add_student_work(self, username: str, works_data: str, **kwargs) -> None:
+    async def add_student_work(self, username: str, works_data: str, **kwargs) -> None:
         raise NotImplementedError
 
     @abstractmethod
-    def remove_student(self, username: str) -> bool:
+    async def remove_student(self, username: str) -> bool:
         return False
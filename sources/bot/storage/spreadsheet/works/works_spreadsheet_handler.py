@@ -11,11 +11,11 @@ class WorksSpreadsheetHandler(BaseWorksSpreadsheetHandler):
         self._handler = SpreadsheetHandler(spreadsheet_id, file_name, _attributes)
         self._works_sheet_title = list(_attributes.keys())[0]
 
-    def create_spreadsheet(self, spreadsheet_title="Информация о лабораторных работах",
-                           row_count=1000, column_count=10) -> None:
-        self._handler.create_spreadsheet(spreadsheet_title, row_count, column_count)
+    async def create_spreadsheet(self, spreadsheet_title="Информация о лабораторных работах",
+                                 row_count=1000, column_count=10) -> None:
+        await self._handler.create_spreadsheet(spreadsheet_title, row_count, column_count)
 
-    def add_student_work(self, username: str, works_data: str, **kwargs) -> None:
+    async def add_student_work(self, username: str, works_data: str, **kwargs) -> None:
         name = kwargs.get("name")
         group = kwargs.get("group")
         subgroup = kwargs.get("subgroup")
@@ -30,10 +30,13 @@ class WorksSpreadsheetHandler(BaseWorksSpreadsheetHandler):
         elif not work:
             raise InvalidSpreadsheetAttributeException("Invalid work value")
         else:
-            self._handler.add_row(self._works_sheet_title, [username, name, group, work])
+            await self._handler.add_row(self._works_sheet_title, [username, name, group, work])
+            await self._handler.flush()
 
-    def remove_student(self, username: str) -> bool:
-        return self._handler.remove_row(self._works_sheet_title, username)
+    async def remove_student(self, username: str) -> bool:
+        is_removed = await self._handler.remove_row(self._works_sheet_title, username)
+        await self._handler.flush()
+        return is_removed
 
     def accept_storage(self, storage):
         storage.visit_works_handler(self)
@@ -53,8 +53,8 @@ class SpreadsheetStorage(BaseSpreadsheetStorage):
         auth_data = user_data.get("auth")
 
         if auth_data == {}:
-            student = auth_handler.get_student_by_username(username)
-            teacher = auth_handler.get_teacher_by_username(username)
+            student = await auth_handler.get_student_by_username(username)
+            teacher = await auth_handler.get_teacher_by_username(username)
 
             if student != {}:
                 user_data["auth"] = student
@@ -100,31 +100,31 @@ class SpreadsheetStorage(BaseSpreadsheetStorage):
 
     async def _write_answers(self, tests_data, auth_data):
         tests_handler: BaseTestsSpreadsheetHandler = self._tests_handler
-        tests_handler.add_result_to_worksheet(tests_data["test_name"], auth_data["name"], tests_data["answers"])
+        await tests_handler.add_result_to_worksheet(tests_data["test_name"], auth_data["name"], tests_data["answers"])
 
     async def _receive_test(self, tests_data, test_link: str):
         tests_handler: BaseTestsSpreadsheetHandler = self._tests_handler
         auth_handler: BaseAuthSpreadsheetHandler = self._auth_handler
-        test_name, test = tests_handler.load_test_by_link(test_link)
+        test_name, test = await tests_handler.load_test_by_link(test_link)
         if tests_data.get("test") is None:
             tests_data["test"] = test
             tests_data["test_name"] = test_name
             # needs to be changed to ids instead of usernames
-            tests_data["students"] = auth_handler.get_student_usernames()
+            tests_data["students"] = await auth_handler.get_student_usernames()
 
     async def _register_work(self, username, works_data, auth_data):
         works_handler: BaseWorksSpreadsheetHandler = self._works_handler
-        works_handler.add_student_work(username, works_data, **auth_data)
+        await works_handler.add_student_work(username, works_data, **auth_data)
 
     async def _register_user(self, username, user_type, auth_data):
         auth_handler: BaseAuthSpreadsheetHandler = self._auth_handler
 
         if user_type == "student":
-            if auth_handler.get_student_by_username(username) == {}:
-                auth_handler.add_student(username, **auth_data)
+            if await auth_handler.get_student_by_username(username) == {}:
+                await auth_handler.add_student(username, **auth_data)
         elif user_type == "teacher":
-            if auth_handler.get_teacher_by_username(username) == {}:
-                auth_handler.add_student(username, **auth_data)
+            if await auth_handler.get_teacher_by_username(username) == {}:
+                await auth_handler.add_student(username, **auth_data)
 
     def _cleanup(self, chat, user):
         chat, user = self.resolve_address(chat=chat, user=user)
@@ -0,0 +1,8 @@
+"""
+Paths config module.
+"""
+import os
+import pathlib
+import sys
+
+SURVEYS_PATH = pathlib.Path(os.path.dirname(sys.argv[0])) / "surveys"  # needs to be configured in config.ini